@@ -3,7 +3,7 @@ from easydict import EasyDict as edict
 from pymodaq.daq_utils.daq_utils import ThreadCommand, getLineInfo, DataFromPlugins, Axis
 from pymodaq.daq_viewer.utility_classes import DAQ_Viewer_base, comon_parameters, main
 
-from qtpy import QtWidgets, QtCore
+from qtpy import QtCore
 
 from ...hardware.picam_utils import define_pymodaq_pyqt_parameter, sort_by_priority_list, remove_settings_from_list
 
@@ -22,6 +22,7 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
         --------
         utility_classes.DAQ_Viewer_base
     """
+    # PyMoDAQ builds the settings tree from the class attribute params, so cameras are listed here.
     _dvcs = PI.list_cameras()
     serialnumbers = [dvc.serial_number for dvc in _dvcs]
 
@@ -44,6 +45,7 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
 
         self.data_shape = 'Data2D'
         self.callback_thread = None
+        self._roi_params = None  # ROI child parameters, cached once the settings tree is built
 
     def _update_all_settings(self):
         """Update all parameters in the interface from the values set in the device.
@@ -60,13 +62,13 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
 
     def _update_rois(self, ):
         """Special method to commit new ROI settings."""
-        new_x = self.settings.child('settable_camera_parameters', 'rois', 'x').value()
-        new_width = self.settings.child('settable_camera_parameters', 'rois', 'width').value()
-        new_xbinning = self.settings.child('settable_camera_parameters', 'rois', 'x_binning').value()
+        new_x = self._roi_params['x'].value()
+        new_width = self._roi_params['width'].value()
+        new_xbinning = self._roi_params['x_binning'].value()
 
-        new_y = self.settings.child('settable_camera_parameters', 'rois', 'y').value()
-        new_height = self.settings.child('settable_camera_parameters', 'rois', 'height').value()
-        new_ybinning = self.settings.child('settable_camera_parameters', 'rois', 'y_binning').value()
+        new_y = self._roi_params['y'].value()
+        new_height = self._roi_params['height'].value()
+        new_ybinning = self._roi_params['y_binning'].value()
 
         # In pylablib, ROIs compare as tuples
         new_roi = (new_x, new_width, new_xbinning, new_y, new_height, new_ybinning)
@@ -106,14 +108,15 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
         try:
             # Get  data from buffer
             frame = self.controller.read_newest_image()
+            # Only 1D (single row/column) frames need to be squeezed
+            if self.data_shape == 'Data1D':
+                frame = np.squeeze(frame)
             # Emit the frame.
             self.data_grabed_signal.emit([DataFromPlugins(name='Picam',
-                                                          data=[np.squeeze(frame)],
+                                                          data=[frame],
                                                           dim=self.data_shape,
                                                           labels=[f'Picam_{self.data_shape}'],
                                                           )])
-            #To make sure that timed events are executed in continuous grab mode
-            QtWidgets.QApplication.processEvents()
 
         except Exception as e:
             self.emit_status(ThreadCommand('Update_Status', [str(e), 'log']))
@@ -267,6 +270,9 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
                                     'type': 'group',
                                     'children': read_only_parameters,
                                     })
+            # Keep references to the ROI parameters, they are read again on every ROI change
+            self._roi_params = {param.name(): param for param in
+                                self.settings.child('settable_camera_parameters', 'rois').children()}
 
             # Prepare the viewer (2D by default)
             self._prepare_view()
@@ -289,6 +295,7 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
         # Terminate the communication
         self.controller.close()
         self.controller = None  # Garbage collect the controller
+        self._roi_params = None
         # Clear all the parameters
         self.settings.child('settable_camera_parameters').clearChildren()
         self.settings.child('settable_camera_parameters').remove()
@@ -307,22 +314,20 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
             if not self.controller.get_attribute(param.title()).can_set_online:
                 param.setOpts(enabled=enabled)
         # The ROIs parameters still need special treatment which is not ideal but well...
-        for param in self.settings.child('settable_camera_parameters', "rois").children():
+        for param in self._roi_params.values():
             param.setOpts(enabled=enabled)
 
     def _prepare_view(self):
         """Preparing a data viewer by emitting temporary data. Typically, needs to be called whenever the
         ROIs are changed"""
-        wx = self.settings.child('settable_camera_parameters', 'rois', 'width').value()
-        wy = self.settings.child('settable_camera_parameters', 'rois', 'height').value()
-        bx = self.settings.child('settable_camera_parameters', 'rois', 'x_binning').value()
-        by = self.settings.child('settable_camera_parameters', 'rois', 'y_binning').value()
+        wx = self._roi_params['width'].value()
+        wy = self._roi_params['height'].value()
+        bx = self._roi_params['x_binning'].value()
+        by = self._roi_params['y_binning'].value()
 
         sizex = wx // bx
         sizey = wy // by
 
-        mock_data = np.zeros((sizey, sizex))
-
         if sizey != 1 and sizex != 1:
             data_shape = 'Data2D'
         else:
@@ -330,12 +335,12 @@ class DAQ_2DViewer_picam(DAQ_Viewer_base):
 
         if data_shape != self.data_shape:
             self.data_shape = data_shape
-            # init the viewers
+            # init the viewers. The mock data is only needed here, so only allocate it when the viewer changes
+            mock_data = np.zeros((sizey, sizex), dtype=np.float32)
             self.data_grabed_signal_temp.emit([DataFromPlugins(name='Picam',
                                                                data=[np.squeeze(mock_data)],
                                                                dim=self.data_shape,
                                                                labels=[f'Picam_{self.data_shape}'])])
-            QtWidgets.QApplication.processEvents()
 
     def grab_data(self, Naverage=1, **kwargs):
         """